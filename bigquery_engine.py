@@ -1,13 +1,153 @@
 import os
 import re
+import sys
+import time
+import functools
+import collections
 import concurrent.futures
+from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional, Any, Union
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 import pyarrow.compute as pc
 
+try:
+    import sqlglot
+    from sqlglot import exp as sge
+except ImportError:
+    sqlglot = None
+    sge = None
+
+try:
+    # Gandiva (LLVM expression compiler) ships with some pyarrow builds
+    import pyarrow.gandiva as gandiva
+except ImportError:
+    gandiva = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Precompiled query patterns (compiling per call is measurable on hot paths)
+_SELECT_RE = re.compile(r'(SELECT\s+.+?)\s+FROM', re.IGNORECASE)
+_FROM_RE = re.compile(r'FROM\s+([^\s;]+)', re.IGNORECASE)
+_WHERE_RE = re.compile(r'WHERE\s+(.+?)(?:\s+LIMIT\s+\d+\s*|$)', re.IGNORECASE)
+_LIMIT_RE = re.compile(r'LIMIT\s+(\d+)', re.IGNORECASE)
+_COMMENT_RE = re.compile(r'--.*?(\n|$)')
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_AND_OR_RE = re.compile(r'\s+AND\s+|\s+OR\s+', re.IGNORECASE)
+_WHERE_PREFIX_RE = re.compile(r'^\s*WHERE\s+', re.IGNORECASE)
+_COL_TOKEN_RE = re.compile(r'[(),]')
+
+# Gandiva function names for the engine's comparison operators
+_GANDIVA_FUNCTIONS = {
+    '>': 'greater_than',
+    '<': 'less_than',
+    '=': 'equal',
+    '>=': 'greater_than_or_equal_to',
+    '<=': 'less_than_or_equal_to',
+    '!=': 'not_equal',
+}
+
+# Mapping from sqlglot comparison nodes to the engine's operator strings
+if sge is not None:
+    _SQLGLOT_OPS = {
+        sge.EQ: '=',
+        sge.NEQ: '!=',
+        sge.GT: '>',
+        sge.LT: '<',
+        sge.GTE: '>=',
+        sge.LTE: '<=',
+    }
+    # For literal-op-column comparisons the operator flips when normalized
+    _FLIPPED_OPS = {'=': '=', '!=': '!=', '>': '<', '<': '>', '>=': '<=', '<=': '>='}
+
+
+@functools.lru_cache(maxsize=16)
+def _numba_comparison_kernel(op: str):
+    """Compile (and cache) a fused compare kernel for one operator.
+
+    Numba specializes the compiled function per input dtype on first
+    call, so caching by operator alone is enough. The kernel writes into
+    a caller-allocated bool array, fusing the comparison and the store
+    into one auto-vectorized pass with no temporaries.
+
+    Returns:
+        Compiled kernel, or None when numba is unavailable
+    """
+    if numba is None:
+        return None
+
+    if op == '>':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] > value
+    elif op == '<':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] < value
+    elif op == '=':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] == value
+    elif op == '>=':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] >= value
+    elif op == '<=':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] <= value
+    elif op == '!=':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] != value
+    else:
+        return None
+
+    return numba.njit(parallel=True, fastmath=True)(kernel)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_sql_ast(sql: str):
+    """Parse SQL text into a sqlglot AST, cached per raw string."""
+    return sqlglot.parse_one(sql, dialect='bigquery')
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedQuery:
+    """Immutable parsed representation of a SQL query.
+
+    Frozen so that cached instances returned by ``_parse_query`` cannot be
+    mutated by downstream code; slots replace the per-instance __dict__
+    with fixed-offset attribute access.
+    """
+    columns: Tuple[str, ...]
+    table: str
+    where: str
+    limit: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class TableInfo:
+    """Immutable table metadata collected by ``_get_table_info``.
+
+    Attribute access resolves at a fixed slot offset rather than through
+    a per-lookup string hash as with the previous dict representation.
+    """
+    name: str
+    schema: pa.Schema
+    files: Tuple[Dict, ...]
+    total_rows: int
+    lower_to_actual: Dict[str, str]
+    dataset: Optional[ds.Dataset]
+
 
 class DremelQueryEngine:
     """A SQL query engine for Parquet files inspired by Google's Dremel architecture.
@@ -20,17 +160,52 @@ class DremelQueryEngine:
     - Nested schema support
     """
     
-    def __init__(self, data_path: str, max_workers: int = None):
+    #: Valid values for ``execution_mode``
+    EXECUTION_MODES = ('arrow_threads', 'thread_pool', 'process_pool')
+
+    def __init__(self, data_path: str, max_workers: int = None,
+                 execution_mode: str = 'arrow_threads'):
         """Initialize the Dremel-inspired query engine.
-        
+
         Args:
             data_path: Directory path where parquet files are stored
             max_workers: Maximum number of parallel workers (defaults to CPU count)
+            execution_mode: How partitions are scanned:
+                'arrow_threads' (default) runs one dataset scan using
+                Arrow's internal thread pool — best for I/O-bound scans;
+                'thread_pool' fans one thread out per file — only helps
+                while PyArrow holds the GIL released;
+                'process_pool' fans one process out per file and stitches
+                results via Arrow IPC — best for CPU-bound partitions
         """
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(
+                f"execution_mode must be one of {self.EXECUTION_MODES}, "
+                f"got: {execution_mode!r}")
         self.data_path = data_path
         self.max_workers = max_workers
+        self.execution_mode = execution_mode
         self.table_cache = {}  # Cache for table metadata
-    
+        # ParquetFile handles keyed by path; each holds the parsed footer
+        # (schema, row-group metadata, statistics) so it is read once
+        self._pq_file_cache: Dict[str, Tuple[float, pq.ParquetFile]] = {}
+        # Directory listing cache: table name -> (expiry, file paths)
+        self._file_list_cache: Dict[str, Tuple[float, List[str]]] = {}
+        self._file_list_ttl = 60.0  # seconds
+        # Compiled Gandiva filters keyed by (schema, normalized predicate)
+        self._gandiva_filter_cache: Dict[Tuple[str, str], Any] = {}
+        # Lowercase -> actual column name maps keyed by column-name tuple
+        self._colmap_cache: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        # Persistent thread pool for 'thread_pool' mode, created on first
+        # use and reused across queries (spawning per query costs ~2xN
+        # thread create/join syscalls)
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # Result-set LRU keyed by (normalized query, file mtime signature);
+        # a changed data file changes the key, so stale hits are impossible
+        self._result_cache: collections.OrderedDict = collections.OrderedDict()
+        self._result_cache_bytes = 0
+        self.result_cache_limit_bytes = 64 * 1024 * 1024
+
     def execute_query(self, query: str) -> pd.DataFrame:
         """Execute a SQL query using Dremel-inspired execution.
         
@@ -41,22 +216,30 @@ class DremelQueryEngine:
             DataFrame with query results
         """
         try:
-            # Parse query
+            # Parse query (cached for repeated queries)
             parsed_query = self._parse_query(query)
-            
+
             # Get table schema and metadata
-            table_info = self._get_table_info(parsed_query["table"])
-            
+            table_info = self._get_table_info(parsed_query.table)
+
             # Perform projection pushdown (select only needed columns)
             needed_columns = self._get_required_columns(
-                table_info, 
-                parsed_query["columns"], 
-                parsed_query["where"]
+                table_info,
+                parsed_query.columns,
+                parsed_query.where
             )
-            
+
             # Perform predicate pushdown (filter at storage level when possible)
-            filters = self._extract_pushdown_filters(parsed_query["where"])
-            
+            filters = self._extract_pushdown_filters(parsed_query.where)
+
+            # Return a cached result when the query and every underlying
+            # file (path, mtime, size) are unchanged
+            result_key = self._result_cache_key(query, table_info)
+            cached = self._result_cache.get(result_key) if result_key else None
+            if cached is not None:
+                self._result_cache.move_to_end(result_key)
+                return cached.to_pandas()
+
             # Execute query with parallel processing
             result = self._execute_distributed_query(
                 table_info,
@@ -64,22 +247,50 @@ class DremelQueryEngine:
                 filters,
                 parsed_query
             )
-            
-            return result
-            
+
+            self._store_cached_result(result_key, result)
+
+            # self_destruct would free buffers the result cache still
+            # references, so only the uncached conversion may use it
+            if result_key and result_key in self._result_cache:
+                return result.to_pandas(split_blocks=True)
+            return result.to_pandas(split_blocks=True, self_destruct=True)
+
         except Exception as e:
             raise RuntimeError(f"Query execution failed: {str(e)}")
+
+    def _result_cache_key(self, query: str, table_info: TableInfo) -> Optional[Tuple]:
+        """Build the result-cache key for a query over current file state."""
+        try:
+            files_signature = tuple(
+                (meta['path'], os.path.getmtime(meta['path']), meta['size_bytes'])
+                for meta in table_info.files
+            )
+        except OSError:
+            return None  # A file vanished; skip caching
+        return (self._clean_query(query), files_signature)
+
+    def _store_cached_result(self, result_key: Optional[Tuple], result: pa.Table):
+        """Insert a result table into the LRU, evicting over the byte budget."""
+        if result_key is None or result.nbytes > self.result_cache_limit_bytes:
+            return
+        self._result_cache[result_key] = result
+        self._result_cache.move_to_end(result_key)
+        self._result_cache_bytes += result.nbytes
+        while self._result_cache_bytes > self.result_cache_limit_bytes:
+            _, evicted = self._result_cache.popitem(last=False)
+            self._result_cache_bytes -= evicted.nbytes
     
     # ---------- Dremel-inspired Processing Methods ----------
     
-    def _get_table_info(self, table_name: str) -> Dict:
+    def _get_table_info(self, table_name: str) -> TableInfo:
         """Get table metadata and file location information.
-        
+
         Args:
             table_name: Name of the table
-            
+
         Returns:
-            Dictionary with table metadata
+            TableInfo with table metadata
         """
         # Check cache first
         if table_name in self.table_cache:
@@ -89,40 +300,101 @@ class DremelQueryEngine:
         table_files = self._find_table_files(table_name)
         if not table_files:
             raise FileNotFoundError(f"Parquet file not found for table: {table_name}")
-        
-        # Read schema from the first file
-        schema = pq.read_schema(table_files[0])
-        
-        # Get metadata for all files (sizes, row counts, etc.)
+
+        # Read schema from the first file's cached footer
+        schema = self._open_parquet_file(table_files[0]).schema_arrow
+
+        # Get metadata for all files (sizes, row counts, etc.), including
+        # per-row-group column statistics for predicate-based pruning
         file_metadata = []
         for file_path in table_files:
-            metadata = pq.read_metadata(file_path)
+            metadata = self._open_parquet_file(file_path).metadata
+            row_groups = []
+            for i in range(metadata.num_row_groups):
+                row_group = metadata.row_group(i)
+                stats = {}
+                for j in range(row_group.num_columns):
+                    column = row_group.column(j)
+                    column_stats = column.statistics
+                    if column_stats is not None and column_stats.has_min_max:
+                        stats[column.path_in_schema] = (
+                            column_stats.min,
+                            column_stats.max,
+                            column_stats.null_count,
+                        )
+                row_groups.append({'num_rows': row_group.num_rows, 'stats': stats})
             file_metadata.append({
                 'path': file_path,
                 'num_rows': metadata.num_rows,
-                'size_bytes': os.path.getsize(file_path)
+                'size_bytes': os.path.getsize(file_path),
+                'row_groups': row_groups
             })
         
-        table_info = {
-            'name': table_name,
-            'schema': schema,
-            'files': file_metadata,
-            'total_rows': sum(m['num_rows'] for m in file_metadata)
-        }
+        # Build a Dataset over the table's files; its scanner coalesces
+        # and pre-buffers column reads asynchronously, which the per-file
+        # synchronous reads cannot do
+        try:
+            parquet_format = ds.ParquetFileFormat(
+                default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+                    pre_buffer=True))
+            dataset = ds.dataset(table_files, format=parquet_format)
+        except Exception:
+            dataset = None  # Fall back to per-file reads
+
+        table_info = TableInfo(
+            name=table_name,
+            schema=schema,
+            files=tuple(file_metadata),
+            total_rows=sum(m['num_rows'] for m in file_metadata),
+            # Pre-lowercased name map so case-insensitive column lookups
+            # are a single dict hit instead of an O(ncols) scan per query
+            lower_to_actual={name.lower(): name for name in schema.names},
+            dataset=dataset
+        )
         
         # Cache the table info
         self.table_cache[table_name] = table_info
         return table_info
     
+    def _open_parquet_file(self, file_path: str) -> pq.ParquetFile:
+        """Open a Parquet file, reusing the cached parsed footer.
+
+        Footer parsing (schema, row-group metadata, statistics) is a known
+        hotspot on short queries over many files; ParquetFile holds the
+        parsed FileMetaData, so cache the handle keyed by path and
+        invalidate when the file's mtime changes.
+
+        Args:
+            file_path: Path to the parquet file
+
+        Returns:
+            Cached (or freshly opened) ParquetFile
+        """
+        mtime = os.path.getmtime(file_path)
+        cached = self._pq_file_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        pq_file = pq.ParquetFile(file_path)
+        self._pq_file_cache[file_path] = (mtime, pq_file)
+        return pq_file
+
     def _find_table_files(self, table_name: str) -> List[str]:
         """Find all parquet files for a table, supporting partitioning.
-        
+
+        Results are cached with a short TTL so repeated queries do not
+        rewalk the directory tree.
+
         Args:
             table_name: Name of the table
-            
+
         Returns:
             List of file paths
         """
+        cached = self._file_list_cache.get(table_name)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         # Possible locations to check
         base_paths = [
             os.path.join(self.data_path, f"{table_name}.parquet"),
@@ -131,37 +403,65 @@ class DremelQueryEngine:
         ]
         
         parquet_files = []
-        
+
         for base_path in base_paths:
             if os.path.isfile(base_path) and base_path.endswith('.parquet'):
                 # Single file case
                 parquet_files.append(base_path)
             elif os.path.isdir(base_path):
                 # Directory case (could be partitioned data)
-                for root, _, files in os.walk(base_path):
-                    for file in files:
-                        if file.endswith('.parquet'):
-                            parquet_files.append(os.path.join(root, file))
-        
+                parquet_files.extend(self._scan_parquet_dir(base_path))
+
+        self._file_list_cache[table_name] = (
+            time.monotonic() + self._file_list_ttl, parquet_files)
         return parquet_files
+
+    @staticmethod
+    def _scan_parquet_dir(dir_path: str) -> List[str]:
+        """Recursively collect parquet files under a directory.
+
+        Uses os.scandir, which returns file type from the directory entry
+        itself — one getdents per directory instead of an extra stat per
+        entry as with os.walk.
+
+        Args:
+            dir_path: Directory to scan
+
+        Returns:
+            Sorted list of parquet file paths
+        """
+        parquet_files = []
+        stack = [dir_path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.parquet'):
+                            parquet_files.append(entry.path)
+            except OSError:
+                continue  # Unreadable subdirectory; skip it
+        return sorted(parquet_files)
     
-    def _get_required_columns(self, table_info: Dict, select_columns: List[str], where_clause: str) -> List[str]:
+    def _get_required_columns(self, table_info: TableInfo, select_columns: Tuple[str, ...], where_clause: str) -> List[str]:
         """Determine which columns are needed for the query (projection pushdown).
-        
+
         Args:
             table_info: Table metadata
             select_columns: Columns in SELECT clause
             where_clause: WHERE clause
-            
+
         Returns:
             List of column names needed
         """
         needed_columns = set()
-        
+
         # Add columns from SELECT
-        if select_columns == ['*']:
+        if select_columns == ('*',):
             # All columns needed
-            needed_columns.update(table_info['schema'].names)
+            needed_columns.update(table_info.schema.names)
         else:
             needed_columns.update(select_columns)
         
@@ -169,8 +469,16 @@ class DremelQueryEngine:
         if where_clause:
             where_columns = self._extract_columns_from_where(where_clause)
             needed_columns.update(where_columns)
-        
-        return list(needed_columns)
+
+        # Resolve to the schema's actual casing via the prebuilt map,
+        # deduplicating references that differ only in case
+        lower_to_actual = table_info.lower_to_actual
+        resolved = []
+        for column in needed_columns:
+            actual = lower_to_actual.get(column.lower(), column)
+            if actual not in resolved:
+                resolved.append(actual)
+        return resolved
     
     def _extract_columns_from_where(self, where_clause: str) -> List[str]:
         """Extract column names referenced in WHERE clause.
@@ -181,12 +489,27 @@ class DremelQueryEngine:
         Returns:
             List of column names
         """
-        # Simple extraction using regex
-        # In a real implementation, this would use a proper SQL parser
-        where_clause = re.sub(r'^\s*WHERE\s+', '', where_clause, flags=re.IGNORECASE)
-        
+        where_clause = _WHERE_PREFIX_RE.sub('', where_clause)
+
+        # Preferred path: walk the sqlglot AST, which handles nesting,
+        # functions and parenthesized expressions correctly
+        if sqlglot is not None:
+            try:
+                tree = _parse_sql_ast(where_clause)
+            except sqlglot.errors.ParseError:
+                pass
+            else:
+                seen = set()
+                columns = []
+                for column in tree.find_all(sge.Column):
+                    if column.name not in seen:
+                        seen.add(column.name)
+                        columns.append(column.name)
+                return columns
+
+        # Fallback: simple extraction using regex
         # Split on AND/OR
-        conditions = re.split(r'\s+AND\s+|\s+OR\s+', where_clause, flags=re.IGNORECASE)
+        conditions = _AND_OR_RE.split(where_clause)
         
         # Extract column names from each condition
         columns = []
@@ -212,12 +535,24 @@ class DremelQueryEngine:
         """
         if not where_clause:
             return []
-            
+
         # Extract basic filters that can be pushed down
         pushdown_filters = []
-        where_clause = re.sub(r'^\s*WHERE\s+', '', where_clause, flags=re.IGNORECASE)
-        
-        # Check for AND conditions (we can push these down)
+        where_clause = _WHERE_PREFIX_RE.sub('', where_clause)
+
+        # Preferred path: walk the sqlglot AST so arbitrarily nested AND
+        # chains push down; filters are only used when they cover the
+        # whole predicate, otherwise the residual filter path applies
+        if sqlglot is not None:
+            try:
+                tree = _parse_sql_ast(where_clause)
+            except sqlglot.errors.ParseError:
+                pass
+            else:
+                filters = DremelQueryEngine._collect_conjunct_filters(tree)
+                return filters if filters is not None else []
+
+        # Fallback: check for AND conditions (we can push these down)
         if ' AND ' in where_clause.upper():
             conditions = where_clause.split(' AND ')
             for condition in conditions:
@@ -237,7 +572,54 @@ class DremelQueryEngine:
                 pass
         
         return pushdown_filters
-    
+
+    @staticmethod
+    def _collect_conjunct_filters(node) -> Optional[List[Tuple]]:
+        """Collect (column, op, value) filters from a conjunctive AST.
+
+        Recurses through nested AND nodes so filters like
+        ``a = 1 AND (b > 2 AND c < 3)`` push down completely.
+
+        Args:
+            node: sqlglot expression node
+
+        Returns:
+            List of filter tuples, or None if any part of the tree cannot
+            be expressed as a pushdown filter (e.g. OR, functions)
+        """
+        if isinstance(node, sge.Paren):
+            return DremelQueryEngine._collect_conjunct_filters(node.this)
+
+        if isinstance(node, sge.And):
+            left = DremelQueryEngine._collect_conjunct_filters(node.left)
+            right = DremelQueryEngine._collect_conjunct_filters(node.right)
+            if left is None or right is None:
+                return None
+            return left + right
+
+        op = _SQLGLOT_OPS.get(type(node))
+        if op is not None:
+            # column <op> literal
+            if isinstance(node.left, sge.Column) and isinstance(node.right, sge.Literal):
+                return [(sys.intern(node.left.name), op,
+                         DremelQueryEngine._literal_value(node.right))]
+            # literal <op> column: normalize by flipping the operator
+            if isinstance(node.left, sge.Literal) and isinstance(node.right, sge.Column):
+                return [(sys.intern(node.right.name), _FLIPPED_OPS[op],
+                         DremelQueryEngine._literal_value(node.left))]
+
+        return None
+
+    @staticmethod
+    def _literal_value(literal) -> Any:
+        """Convert a sqlglot Literal into a Python value."""
+        if literal.is_string:
+            return literal.this
+        try:
+            return int(literal.this)
+        except ValueError:
+            return float(literal.this)
+
     def _parse_condition(self, condition: str) -> Tuple[str, str, Any]:
         """Parse a WHERE condition into column, operator, and value.
         
@@ -255,7 +637,8 @@ class DremelQueryEngine:
         for op in operators:
             if op in condition:
                 parts = condition.split(op, 1)
-                column = parts[0].strip()
+                # Interned so repeated filter columns compare by identity
+                column = sys.intern(parts[0].strip())
                 value = parts[1].strip()
                 
                 # Handle quoted strings
@@ -276,285 +659,937 @@ class DremelQueryEngine:
         
         raise ValueError(f"No valid operator found in condition: {condition}")
     
-    def _execute_distributed_query(self, table_info: Dict, columns: List[str], 
-                               filters: List[Tuple], parsed_query: Dict) -> pd.DataFrame:
+    def _execute_distributed_query(self, table_info: TableInfo, columns: List[str],
+                               filters: List[Tuple], parsed_query: ParsedQuery) -> pa.Table:
         """Execute query in parallel across multiple files/partitions.
-        
+
         Args:
             table_info: Table metadata
             columns: Columns to read
             filters: Filters to push down
             parsed_query: Parsed query information
-            
+
         Returns:
-            Combined query results
+            Combined query results as an Arrow Table
         """
-        file_paths = [meta['path'] for meta in table_info['files']]
-        
-        # Execute in parallel using thread pool
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_file = {
+        # Preferred path: one dataset scan with internal async I/O and
+        # its own thread pool
+        if self.execution_mode == 'arrow_threads' and table_info.dataset is not None:
+            return self._execute_dataset_scan(table_info, columns, parsed_query)
+
+        # Per-file fan-out over workers (threads or processes)
+        if self.execution_mode == 'process_pool':
+            results = self._scan_partitions_process_pool(
+                table_info, columns, filters, parsed_query)
+        else:
+            results = self._scan_partitions_thread_pool(
+                table_info, columns, filters, parsed_query)
+
+        # Combine results from all partitions (zero-copy chunked assembly)
+        if not results:
+            # Empty table with the correct columns
+            names = columns if columns != ['*'] else table_info.schema.names
+            fields = [table_info.schema.field(name) for name in names
+                      if name in table_info.schema.names]
+            return pa.schema(fields).empty_table()
+
+        combined = pa.concat_tables(results, promote_options='permissive')
+        results.clear()  # the combined table owns the chunks now
+
+        # Apply LIMIT (after combining to ensure correct results)
+        if parsed_query.limit is not None:
+            combined = combined.slice(0, parsed_query.limit)
+
+        return combined
+
+    def _scan_partitions_thread_pool(self, table_info: TableInfo, columns: List[str],
+                                 filters: List[Tuple],
+                                 parsed_query: ParsedQuery) -> List[pa.Table]:
+        """Scan partitions with one thread per file.
+
+        Only profitable while PyArrow releases the GIL during decode;
+        CPU-bound post-processing should use 'process_pool' instead.
+        """
+        file_metas = list(table_info.files)
+        if parsed_query.limit is not None:
+            # Smallest files first so the limit is satisfied with the
+            # least I/O and remaining reads can be cancelled
+            file_metas = sorted(file_metas, key=lambda m: m['num_rows'])
+
+        executor = self._thread_pool()
+        pending = collections.deque(
+            (executor.submit(
+                self._process_file_partition,
+                file_meta,
+                columns,
+                filters,
+                parsed_query
+            ), file_meta['path'])
+            for file_meta in file_metas
+        )
+
+        # Collect results; partition outputs are already filtered, so
+        # counting their rows against the LIMIT budget is safe. Futures
+        # are popped as they are consumed so each partition's buffers can
+        # be reclaimed before the remaining futures resolve, instead of
+        # holding every partition alive until the loop ends
+        results = []
+        row_count = 0
+        while pending:
+            future, file_path = pending.popleft()
+            if parsed_query.limit is not None and row_count >= parsed_query.limit:
+                future.cancel()
+                continue
+            try:
+                result = future.result()
+                future = None  # drop the last reference to the future's result
+                if result is not None and len(result) > 0:
+                    results.append(result)
+                    row_count += len(result)
+                result = None
+            except Exception as e:
+                # Log error but continue with other partitions
+                print(f"Error processing partition {file_path}: {e}")
+
+        return results
+
+    def _scan_partitions_process_pool(self, table_info: TableInfo, columns: List[str],
+                                  filters: List[Tuple],
+                                  parsed_query: ParsedQuery) -> List[pa.Table]:
+        """Scan partitions with one process per file.
+
+        Sidesteps the GIL entirely for CPU-bound partition work; workers
+        return Arrow IPC stream bytes, which deserialize without copying
+        the column buffers a second time.
+        """
+        max_workers = self.max_workers or os.cpu_count()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
                 executor.submit(
-                    self._process_file_partition, 
-                    file_path, 
-                    columns, 
-                    filters, 
+                    _scan_partition_worker,
+                    file_meta,
+                    tuple(columns),
+                    tuple(filters),
                     parsed_query
-                ): file_path 
-                for file_path in file_paths
-            }
-            
-            # Collect results
+                )
+                for file_meta in table_info.files
+            ]
+
+            # Clear each slot as its future completes so the worker's IPC
+            # payload is freed as soon as it has been deserialized
+            slots = {future: index for index, future in enumerate(futures)}
             results = []
-            for future in concurrent.futures.as_completed(future_to_file):
+            for future in concurrent.futures.as_completed(slots):
+                futures[slots.pop(future)] = None
                 try:
-                    result = future.result()
-                    if result is not None and len(result) > 0:
-                        results.append(result)
+                    payload = future.result()
+                    future = None
+                    if payload is not None:
+                        table = pa.ipc.open_stream(payload).read_all()
+                        del payload
+                        if len(table) > 0:
+                            results.append(table)
                 except Exception as e:
                     # Log error but continue with other partitions
                     print(f"Error processing partition: {e}")
-        
-        # Combine results from all partitions
-        if not results:
-            # Create empty DataFrame with correct columns
-            return pd.DataFrame(columns=columns if columns != ['*'] else table_info['schema'].names)
-        
-        combined_df = pd.concat(results, ignore_index=True)
-        
-        # Apply LIMIT (after combining to ensure correct results)
-        if parsed_query["limit"] is not None:
-            combined_df = combined_df.head(parsed_query["limit"])
-            
-        return combined_df
-    
-    def _process_file_partition(self, file_path: str, columns: List[str], 
-                           filters: List[Tuple], parsed_query: Dict) -> pd.DataFrame:
+
+        return results
+
+    def _execute_dataset_scan(self, table_info: TableInfo, columns: List[str],
+                          parsed_query: ParsedQuery) -> pa.Table:
+        """Execute the query as a single Dataset scan.
+
+        The scanner schedules asynchronous, coalesced column reads across
+        all files (with pre-buffering enabled on the Parquet format) and
+        prunes row groups internally from the filter expression.
+
+        Args:
+            table_info: Table metadata
+            columns: Columns to read
+            parsed_query: Parsed query information
+
+        Returns:
+            Combined query results
+        """
+        filter_expr = self._build_pc_expression(
+            parsed_query.where, table_info.lower_to_actual)
+
+        scanner = table_info.dataset.scanner(
+            columns=columns if columns != ['*'] else None,
+            filter=filter_expr,
+            batch_size=65536,
+            use_threads=True
+        )
+
+        residual_where = parsed_query.where if filter_expr is None else ""
+
+        if parsed_query.limit is not None:
+            # LIMIT pushdown: consume batches and stop issuing reads as
+            # soon as enough matching rows have accumulated
+            pieces = []
+            row_count = 0
+            for batch in scanner.to_batches():
+                piece = pa.Table.from_batches([batch])
+                if residual_where:
+                    piece = self._apply_where_conditions(piece, residual_where)
+                if len(piece) > 0:
+                    pieces.append(piece)
+                    row_count += len(piece)
+                if row_count >= parsed_query.limit:
+                    break
+            if pieces:
+                table = pa.concat_tables(pieces, promote_options='permissive')
+            else:
+                table = scanner.projected_schema.empty_table()
+        else:
+            table = scanner.to_table()
+            # Apply any predicate no expression could be built for
+            if residual_where:
+                table = self._apply_where_conditions(table, residual_where)
+
+        # Drop predicate-only columns from the projection
+        if parsed_query.columns != ('*',):
+            table = self._select_columns(table, parsed_query.columns)
+
+        if parsed_query.limit is not None:
+            table = table.slice(0, parsed_query.limit)
+
+        return table
+
+    def _process_file_partition(self, file_meta: Dict, columns: List[str],
+                           filters: List[Tuple], parsed_query: ParsedQuery) -> Optional[pa.Table]:
         """Process a single file partition with pushdown optimizations.
-        
+
+        The partition stays in Arrow format end-to-end; conversion to
+        pandas happens once on the final combined result.
+
         Args:
-            file_path: Path to parquet file
+            file_meta: File metadata dict (path, row-group statistics)
             columns: Columns to read
             filters: Filters to push down
             parsed_query: Parsed query
-            
+
         Returns:
-            DataFrame with results from this partition
+            Arrow Table with results from this partition
         """
-        # Convert our filters to PyArrow filter format
-        pyarrow_filters = self._convert_to_pyarrow_filters(filters)
-        
+        file_path = file_meta['path']
+
+        # Build a single vectorized filter expression for the whole WHERE
+        # clause; it is evaluated by Arrow's SIMD compute kernels
+        filter_expr = self._build_pc_expression(parsed_query.where)
+
         # Use PyArrow for columnar processing with pushdown
         try:
-            # Read only needed columns (projection pushdown)
-            table = pq.read_table(
-                file_path,
-                columns=columns if columns != ['*'] else None, 
-                filters=pyarrow_filters
-            )
-            
-            # Apply any remaining filters that couldn't be pushed down
-            if parsed_query["where"] and not pyarrow_filters:
-                # Convert to pandas to apply remaining filters
-                df = table.to_pandas()
-                df = self._apply_where_conditions(df, parsed_query["where"])
+            # Prune row groups whose min/max statistics exclude the
+            # predicate before issuing any reads
+            row_groups = self._prune_row_groups(file_meta, filters)
+            if row_groups is not None and not row_groups:
+                # Statistics exclude every row group in this file
+                return None
+
+            # LIMIT pushdown: with no predicate every row matches, so
+            # reading just enough row groups to cover the limit suffices
+            if parsed_query.limit is not None and not parsed_query.where:
+                all_row_groups = file_meta.get('row_groups') or []
+                budget = parsed_query.limit
+                capped = []
+                for index, row_group in enumerate(all_row_groups):
+                    if budget <= 0:
+                        break
+                    capped.append(index)
+                    budget -= row_group['num_rows']
+                if capped and len(capped) < len(all_row_groups):
+                    row_groups = capped
+
+            # Read only needed columns (projection pushdown); the cached
+            # ParquetFile handle avoids re-parsing the footer per query
+            pq_file = self._open_parquet_file(file_path)
+
+            # Dictionary probe: for a string-equality filter, a row group
+            # whose dictionary page lacks the value cannot match, and the
+            # probe only decodes one dictionary-encoded column
+            dict_eq = self._dict_eq_filter(filters)
+            if dict_eq is not None:
+                row_groups = self._prune_row_groups_by_dictionary(
+                    file_meta, row_groups, dict_eq[0], dict_eq[1])
+                if row_groups is not None and not row_groups:
+                    return None
+
+            read_columns = columns if columns != ['*'] else None
+            if row_groups is not None:
+                table = pq_file.read_row_groups(row_groups, columns=read_columns)
             else:
-                df = table.to_pandas()
-                
+                table = pq_file.read(columns=read_columns)
+
+            # Apply the predicate with Arrow's vectorized kernels
+            if filter_expr is not None:
+                table = table.filter(filter_expr)
+            elif parsed_query.where:
+                table = self._apply_where_conditions(table, parsed_query.where)
+
             # Select columns if needed
-            if parsed_query["columns"] != ['*']:
-                df = self._select_columns(df, parsed_query["columns"])
-                
-            return df
-            
+            if parsed_query.columns != ('*',):
+                table = self._select_columns(table, parsed_query.columns)
+
+            return table
+
         except Exception as e:
             print(f"Error processing file {file_path}: {e}")
             return None
     
-    def _convert_to_pyarrow_filters(self, filters: List[Tuple]) -> List:
-        """Convert our filter format to PyArrow's filter format.
-        
+    @staticmethod
+    def _dict_eq_filter(filters: List[Tuple]) -> Optional[Tuple[str, str]]:
+        """Pick a string-equality filter suitable for dictionary probing.
+
         Args:
-            filters: List of (column, op, value) tuples
-            
+            filters: List of (column, op, value) pushdown filters
+
+        Returns:
+            (column, value) for the first string equality, or None
+        """
+        for column, op, value in filters:
+            if op == '=' and isinstance(value, str):
+                return column, value
+        return None
+
+    def _prune_row_groups_by_dictionary(self, file_meta: Dict,
+                                    row_groups: Optional[List[int]],
+                                    column: str, value: str) -> Optional[List[int]]:
+        """Drop row groups whose dictionary does not contain a value.
+
+        Reads only the filter column per candidate row group through a
+        handle opened with ``read_dictionary`` so the column arrives as a
+        DictionaryArray; membership is checked against the dictionary
+        values (a handful of strings) instead of the decoded column. Row
+        groups where the value is absent are skipped without reading the
+        remaining projected columns.
+
+        Args:
+            file_meta: File metadata dict with 'row_groups' statistics
+            row_groups: Candidate indices from statistics pruning, or None
+            column: Column of the string-equality filter
+            value: String literal the filter compares against
+
+        Returns:
+            Surviving row-group indices, or None if probing does not apply
+        """
+        all_row_groups = file_meta.get('row_groups') or []
+        candidates = row_groups if row_groups is not None else list(range(len(all_row_groups)))
+        if not candidates:
+            return row_groups
+
+        try:
+            dict_file = pq.ParquetFile(file_meta['path'], read_dictionary=[column])
+        except Exception:
+            return row_groups  # Column missing or unreadable; no pruning
+
+        kept = []
+        for index in candidates:
+            try:
+                probe = dict_file.read_row_group(index, columns=[column],
+                                                 use_threads=False).column(0)
+            except Exception:
+                return row_groups  # Column missing or unreadable; no pruning
+
+            present = False
+            for piece in probe.chunks:
+                if not pa.types.is_dictionary(piece.type):
+                    return row_groups  # Plain-encoded; probing buys nothing
+                if pc.index(piece.dictionary, value).as_py() != -1:
+                    present = True
+                    break
+            if present:
+                kept.append(index)
+
+        if len(kept) == len(all_row_groups):
+            return None  # Nothing pruned; use the plain full read
+        return kept
+
+    def _prune_row_groups(self, file_meta: Dict, filters: List[Tuple]) -> Optional[List[int]]:
+        """Select row groups that can satisfy the pushdown filters.
+
+        Evaluates each (column, op, value) filter against the row-group
+        min/max statistics collected in ``_get_table_info``; row groups
+        whose value ranges cannot match are skipped entirely.
+
+        Args:
+            file_meta: File metadata dict with 'row_groups' statistics
+            filters: List of (column, op, value) pushdown filters
+
         Returns:
-            PyArrow compatible filter list
+            List of candidate row-group indices, or None if no pruning
+            applies (read everything)
         """
         if not filters:
             return None
-            
-        pyarrow_filters = []
-        
-        # Convert each filter to PyArrow format
-        for column, op, value in filters:
+
+        row_groups = file_meta.get('row_groups')
+        if not row_groups:
+            return None
+
+        candidates = []
+        for index, row_group in enumerate(row_groups):
+            stats = row_group['stats']
+            if all(self._row_group_may_match(stats, column, op, value)
+                   for column, op, value in filters):
+                candidates.append(index)
+
+        if len(candidates) == len(row_groups):
+            return None  # Nothing pruned; use the plain full read
+        return candidates
+
+    @staticmethod
+    def _row_group_may_match(stats: Dict, column: str, op: str, value: Any) -> bool:
+        """Check whether a row group's min/max range can satisfy a filter."""
+        bounds = stats.get(column)
+        if bounds is None:
+            return True  # No statistics; cannot prune
+
+        min_value, max_value, _ = bounds
+        try:
             if op == '=':
-                pyarrow_filters.append((column, '==', value))
-            elif op in ['>', '<', '>=', '<=', '!=']:
-                pyarrow_filters.append((column, op, value))
-        
-        return pyarrow_filters
-    
+                return min_value <= value <= max_value
+            elif op == '!=':
+                return not (min_value == value == max_value)
+            elif op == '>':
+                return max_value > value
+            elif op == '>=':
+                return max_value >= value
+            elif op == '<':
+                return min_value < value
+            elif op == '<=':
+                return min_value <= value
+        except TypeError:
+            return True  # Incomparable types; cannot prune
+        return True
+
+    def _build_pc_expression(self, where_clause: str,
+                         lower_to_actual: Optional[Dict[str, str]] = None) -> Optional[pc.Expression]:
+        """Build one pyarrow.compute Expression for a WHERE clause.
+
+        A single expression lets Arrow evaluate the whole predicate (AND,
+        OR and comparisons) in vectorized kernels, and can be handed to
+        ``pq.read_table(filters=...)`` for storage-level pushdown.
+
+        Args:
+            where_clause: The WHERE part of the SQL query
+            lower_to_actual: Optional lowercase -> actual column name map
+                used to resolve case-insensitive column references
+
+        Returns:
+            Combined Expression, or None if the clause cannot be expressed
+        """
+        if not where_clause:
+            return None
+
+        condition = _WHERE_PREFIX_RE.sub('', where_clause)
+
+        if sqlglot is not None:
+            try:
+                tree = _parse_sql_ast(condition)
+            except sqlglot.errors.ParseError:
+                return None
+            return self._expression_from_ast(tree, lower_to_actual)
+
+        # Fallback without sqlglot: mirror the string-split evaluator
+        try:
+            if ' AND ' in condition.upper():
+                expr = None
+                for part in condition.split(' AND '):
+                    term = self._comparison_expression(
+                        *self._parse_condition(part), lower_to_actual)
+                    expr = term if expr is None else expr & term
+                return expr
+            elif ' OR ' in condition.upper():
+                expr = None
+                for part in condition.split(' OR '):
+                    term = self._comparison_expression(
+                        *self._parse_condition(part), lower_to_actual)
+                    expr = term if expr is None else expr | term
+                return expr
+            else:
+                return self._comparison_expression(
+                    *self._parse_condition(condition), lower_to_actual)
+        except ValueError:
+            return None
+
+    def _expression_from_ast(self, node,
+                         lower_to_actual: Optional[Dict[str, str]] = None) -> Optional[pc.Expression]:
+        """Recursively map a sqlglot AST to a pyarrow.compute Expression."""
+        if isinstance(node, sge.Paren):
+            return self._expression_from_ast(node.this, lower_to_actual)
+
+        if isinstance(node, (sge.And, sge.Or)):
+            left = self._expression_from_ast(node.left, lower_to_actual)
+            right = self._expression_from_ast(node.right, lower_to_actual)
+            if left is None or right is None:
+                return None
+            return left & right if isinstance(node, sge.And) else left | right
+
+        op = _SQLGLOT_OPS.get(type(node))
+        if op is not None:
+            if isinstance(node.left, sge.Column) and isinstance(node.right, sge.Literal):
+                return self._comparison_expression(
+                    node.left.name, op, self._literal_value(node.right),
+                    lower_to_actual)
+            if isinstance(node.left, sge.Literal) and isinstance(node.right, sge.Column):
+                return self._comparison_expression(
+                    node.right.name, _FLIPPED_OPS[op],
+                    self._literal_value(node.left), lower_to_actual)
+
+        return None
+
+    @staticmethod
+    def _comparison_expression(column: str, op: str, value: Any,
+                           lower_to_actual: Optional[Dict[str, str]] = None) -> pc.Expression:
+        """Build a single comparison Expression for a (column, op, value)."""
+        if lower_to_actual is not None:
+            column = lower_to_actual.get(column.lower(), column)
+        field = pc.field(column)
+        if op == '>':
+            return field > pc.scalar(value)
+        elif op == '<':
+            return field < pc.scalar(value)
+        elif op == '=':
+            return field == pc.scalar(value)
+        elif op == '>=':
+            return field >= pc.scalar(value)
+        elif op == '<=':
+            return field <= pc.scalar(value)
+        elif op == '!=':
+            return field != pc.scalar(value)
+        else:
+            raise ValueError(f"Unsupported operator: {op}")
+
+    @staticmethod
+    def _numpy_condition_mask(col: pa.ChunkedArray, op: str, value: Any):
+        """Build a condition mask by comparing NumPy views of Arrow buffers.
+
+        Only applies to null-free primitive numeric columns, where
+        ``to_numpy(zero_copy_only=True)`` hands back a view of the Arrow
+        buffer and the comparison dispatches to NumPy's vectorized
+        kernels with no allocation beyond the bool mask.
+
+        Returns:
+            Boolean ChunkedArray mask, or None when the fast path does
+            not apply
+        """
+        if not (pa.types.is_integer(col.type) or pa.types.is_floating(col.type)):
+            return None
+        if col.null_count != 0:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+
+        kernel = _numba_comparison_kernel(op) if numba is not None else None
+
+        try:
+            chunk_masks = []
+            for chunk in col.chunks:
+                arr = chunk.to_numpy(zero_copy_only=True)
+                chunk_mask = None
+                if kernel is not None:
+                    out = np.empty(arr.size, dtype=np.bool_)
+                    try:
+                        kernel(arr, value, out)
+                        chunk_mask = out
+                    except Exception:
+                        kernel = None  # Unsupported combination; don't retry
+                if chunk_mask is not None:
+                    chunk_masks.append(pa.array(chunk_mask))
+                    continue
+                if op == '>':
+                    chunk_mask = arr > value
+                elif op == '<':
+                    chunk_mask = arr < value
+                elif op == '=':
+                    chunk_mask = arr == value
+                elif op == '>=':
+                    chunk_mask = arr >= value
+                elif op == '<=':
+                    chunk_mask = arr <= value
+                elif op == '!=':
+                    chunk_mask = arr != value
+                else:
+                    return None
+                chunk_masks.append(pa.array(chunk_mask))
+            return pa.chunked_array(chunk_masks, type=pa.bool_())
+        except (pa.ArrowInvalid, ValueError):
+            return None
+
     # ---------- Legacy methods from original QueryEngine ----------
     
-    def _parse_query(self, query: str) -> Dict[str, Any]:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _parse_query(query: str) -> ParsedQuery:
         """Parse SQL query into components.
-        
+
+        Results are cached so repeated queries (dashboards, templated
+        loops) skip the regex work entirely.
+
         Args:
             query: SQL query string
-            
+
         Returns:
-            Dictionary with query components
+            ParsedQuery with query components
         """
+        if sqlglot is not None:
+            return DremelQueryEngine._parse_query_ast(query)
+
+        # Fallback: regex-based parsing when sqlglot is unavailable
         # Clean query
-        query = self._clean_query(query)
-        
+        query = DremelQueryEngine._clean_query(query)
+
         # Extract query parts
-        select_match = re.search(r'(SELECT\s+.+?)\s+FROM', query, re.IGNORECASE)
-        from_match = re.search(r'FROM\s+([^\s;]+)', query, re.IGNORECASE)
-        where_match = re.search(r'WHERE\s+(.+?)(?:\s+LIMIT\s+\d+\s*|$)', query, re.IGNORECASE)
-        
+        select_match = _SELECT_RE.search(query)
+        from_match = _FROM_RE.search(query)
+        where_match = _WHERE_RE.search(query)
+
         if not select_match or not from_match:
             raise ValueError("Query must contain both SELECT and FROM clauses")
-        
+
         select_part = select_match.group(1)
         from_part = from_match.group(0)
-        where_part = where_match.group(0) if where_match else ""
-        
+        where_part = f"WHERE {where_match.group(1)}" if where_match else ""
+
         # Extract components
-        columns = self._extract_columns(select_part)
-        table_name = self._extract_table_name(from_part)
-        limit_value = self._extract_limit(query)
-        
-        return {
-            "columns": columns,
-            "table": table_name,
-            "where": where_part,
-            "limit": limit_value
-        }
-    
-    def _clean_query(self, query: str) -> str:
+        columns = DremelQueryEngine._extract_columns(select_part)
+        table_name = DremelQueryEngine._extract_table_name(from_part)
+        limit_value = DremelQueryEngine._extract_limit(query)
+
+        return ParsedQuery(
+            columns=tuple(columns),
+            table=table_name,
+            where=where_part,
+            limit=limit_value
+        )
+
+    @staticmethod
+    def _parse_query_ast(query: str) -> ParsedQuery:
+        """Parse a query with sqlglot in a single pass over the AST.
+
+        Unlike the regex fallback, this handles functions, parentheses and
+        nested boolean expressions without re-scanning the query string.
+
+        Args:
+            query: SQL query string
+
+        Returns:
+            ParsedQuery with query components
+
+        Raises:
+            ValueError: If the query is not a valid SELECT statement
+        """
+        try:
+            tree = _parse_sql_ast(query)
+        except sqlglot.errors.ParseError as e:
+            raise ValueError(f"Invalid SQL query: {e}")
+
+        if not isinstance(tree, sge.Select):
+            raise ValueError("Query must contain both SELECT and FROM clauses")
+
+        from_clause = tree.find(sge.From)
+        if from_clause is None or not tree.expressions:
+            raise ValueError("Query must contain both SELECT and FROM clauses")
+
+        columns = tuple(
+            '*' if isinstance(proj, sge.Star) else proj.sql(dialect='bigquery')
+            for proj in tree.expressions
+        )
+        table_name = from_clause.this.sql(dialect='bigquery')
+
+        where_clause = tree.args.get('where')
+        where_part = (
+            f"WHERE {where_clause.this.sql(dialect='bigquery')}"
+            if where_clause is not None else ""
+        )
+
+        limit_clause = tree.args.get('limit')
+        limit_value = (
+            int(limit_clause.expression.this)
+            if limit_clause is not None else None
+        )
+
+        return ParsedQuery(
+            columns=columns,
+            table=table_name,
+            where=where_part,
+            limit=limit_value
+        )
+
+    @staticmethod
+    def _clean_query(query: str) -> str:
         """Remove comments and normalize whitespace."""
-        query = re.sub(r'--.*?(\n|$)', ' ', query)
-        query = re.sub(r'/\*.*?\*/', ' ', query, flags=re.DOTALL)
+        query = _COMMENT_RE.sub(' ', query)
+        query = _BLOCK_COMMENT_RE.sub(' ', query)
         return ' '.join(query.split())
-    
-    def _extract_columns(self, select_stmt: str) -> List[str]:
-        """Extract column names from SELECT statement."""
+
+    @staticmethod
+    def _extract_columns(select_stmt: str) -> List[str]:
+        """Extract column names from SELECT statement.
+
+        The C regex engine scans for structural characters so Python only
+        iterates over the commas and parentheses, not every character —
+        O(separators) instead of O(length) interpreter dispatches.
+        """
         if '*' in select_stmt:
             return ['*']
-        
+
         columns_part = select_stmt.strip().replace('SELECT', '', 1).strip()
         columns = []
-        current_col = ""
         paren_count = 0
-        
-        for char in columns_part:
-            if char == '(' and paren_count == 0:
+        start = 0
+
+        # Split on commas at parenthesis depth 0 (function calls intact)
+        for match in _COL_TOKEN_RE.finditer(columns_part):
+            token = match.group()
+            if token == '(':
                 paren_count += 1
-                current_col += char
-            elif char == ')' and paren_count > 0:
-                paren_count -= 1
-                current_col += char
-            elif char == ',' and paren_count == 0:
-                columns.append(current_col.strip())
-                current_col = ""
-            else:
-                current_col += char
-                
-        if current_col.strip():
-            columns.append(current_col.strip())
-            
+            elif token == ')':
+                if paren_count > 0:
+                    paren_count -= 1
+            elif paren_count == 0:
+                column = columns_part[start:match.start()].strip()
+                if column:
+                    columns.append(column)
+                start = match.end()
+
+        column = columns_part[start:].strip()
+        if column:
+            columns.append(column)
+
         return columns
     
-    def _extract_table_name(self, from_stmt: str) -> str:
+    @staticmethod
+    def _extract_table_name(from_stmt: str) -> str:
         """Extract table name from FROM statement."""
-        match = re.search(r'FROM\s+([^\s;]+)', from_stmt, re.IGNORECASE)
+        match = _FROM_RE.search(from_stmt)
         if match:
             return match.group(1).strip()
         raise ValueError(f"Could not extract table name from: {from_stmt}")
-    
-    def _extract_limit(self, query: str) -> Optional[int]:
+
+    @staticmethod
+    def _extract_limit(query: str) -> Optional[int]:
         """Extract LIMIT value from query."""
-        match = re.search(r'LIMIT\s+(\d+)', query, re.IGNORECASE)
+        match = _LIMIT_RE.search(query)
         if match:
             return int(match.group(1))
         return None
     
-    def _select_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
-        """Select columns from DataFrame, handling case sensitivity."""
+    def _select_columns(self, table: pa.Table, columns: Tuple[str, ...]) -> pa.Table:
+        """Select columns from an Arrow Table, handling case sensitivity.
+
+        Resolution is a dict lookup against a cached lowercase map rather
+        than an O(ncols) scan per requested column.
+        """
+        key = tuple(table.column_names)
+        colmap = self._colmap_cache.get(key)
+        if colmap is None:
+            colmap = {name.lower(): name for name in table.column_names}
+            self._colmap_cache[key] = colmap
+
         actual_columns = []
-        
         for col in columns:
-            # Try exact match first
-            if col in df.columns:
-                actual_columns.append(col)
-            else:
-                # Try case-insensitive match
-                matches = [c for c in df.columns if c.lower() == col.lower()]
-                if matches:
-                    actual_columns.append(matches[0])
-                else:
-                    raise ValueError(f"Column not found: {col}")
-        
-        return df[actual_columns]
-    
-    def _apply_where_conditions(self, df: pd.DataFrame, where_clause: str) -> pd.DataFrame:
-        """Apply WHERE conditions to the DataFrame."""
+            actual = colmap.get(col.lower())
+            if actual is None:
+                raise ValueError(f"Column not found: {col}")
+            actual_columns.append(actual)
+
+        return table.select(actual_columns)
+
+    def _apply_where_conditions(self, table: pa.Table, where_clause: str) -> pa.Table:
+        """Apply WHERE conditions to an Arrow Table using compute kernels."""
         if not where_clause:
-            return df
-            
+            return table
+
         # Remove 'WHERE' keyword
-        where_clause = re.sub(r'^\s*WHERE\s+', '', where_clause, flags=re.IGNORECASE)
-        
+        where_clause = _WHERE_PREFIX_RE.sub('', where_clause)
+
+        # Predicates reused across partitions run fastest as a Gandiva
+        # (LLVM) compiled filter; falls through to pyarrow.compute when
+        # gandiva is unavailable or the predicate cannot be compiled
+        filtered = self._apply_gandiva_filter(table, where_clause)
+        if filtered is not None:
+            return filtered
+
         # Handle AND conditions
         if ' AND ' in where_clause.upper():
             conditions = where_clause.split(' AND ')
             for condition in conditions:
                 column, op, value = self._parse_condition(condition)
-                df = self._apply_condition(df, column, op, value)
-            return df
-            
+                table = self._apply_condition(table, column, op, value)
+            return table
+
         # Handle OR conditions
         elif ' OR ' in where_clause.upper():
             conditions = where_clause.split(' OR ')
-            mask = pd.Series(False, index=df.index)
-            
+            mask = None
+
             for condition in conditions:
                 column, op, value = self._parse_condition(condition)
-                mask |= self._create_condition_mask(df, column, op, value)
-                
-            return df[mask]
-            
+                condition_mask = self._create_condition_mask(table, column, op, value)
+                mask = condition_mask if mask is None else pc.or_(mask, condition_mask)
+
+            return table.filter(mask)
+
         else:
             # Single condition
             column, op, value = self._parse_condition(where_clause)
-            return self._apply_condition(df, column, op, value)
-    
-    def _apply_condition(self, df: pd.DataFrame, column: str, op: str, value: Any) -> pd.DataFrame:
-        """Apply a WHERE condition to the DataFrame."""
-        mask = self._create_condition_mask(df, column, op, value)
-        return df[mask]
-    
-    def _create_condition_mask(self, df: pd.DataFrame, column: str, op: str, value: Any) -> pd.Series:
-        """Create a boolean mask for a condition."""
+            return self._apply_condition(table, column, op, value)
+
+    def _apply_gandiva_filter(self, table: pa.Table, condition: str) -> Optional[pa.Table]:
+        """Filter a table with a Gandiva-compiled predicate, if possible.
+
+        The compiled gandiva.Filter is cached keyed by (schema, predicate)
+        so the LLVM compilation cost is paid once per predicate shape and
+        amortized across partitions and queries.
+
+        Args:
+            table: Input Arrow Table
+            condition: WHERE condition (keyword already stripped)
+
+        Returns:
+            Filtered table, or None when Gandiva is unavailable or the
+            predicate cannot be compiled (caller falls back to compute
+            kernels)
+        """
+        if gandiva is None:
+            return None
+
+        key = (str(table.schema), condition)
+        gandiva_filter = self._gandiva_filter_cache.get(key)
+        if gandiva_filter is None:
+            try:
+                builder = gandiva.TreeExprBuilder()
+                node = self._build_gandiva_node(builder, table.schema, condition)
+                gandiva_filter = gandiva.make_filter(
+                    table.schema, builder.make_condition(node))
+            except Exception:
+                return None
+            self._gandiva_filter_cache[key] = gandiva_filter
+
+        try:
+            pool = pa.default_memory_pool()
+            batches = []
+            for batch in table.to_batches():
+                selection = gandiva_filter.evaluate(batch, pool)
+                batches.append(batch.take(selection.to_array()))
+            return pa.Table.from_batches(batches, schema=table.schema)
+        except Exception:
+            return None
+
+    def _build_gandiva_node(self, builder, schema: pa.Schema, condition: str):
+        """Translate a WHERE condition into a Gandiva expression node."""
+        if ' AND ' in condition.upper():
+            parts = condition.split(' AND ')
+            combine = builder.make_and
+        elif ' OR ' in condition.upper():
+            parts = condition.split(' OR ')
+            combine = builder.make_or
+        else:
+            parts = [condition]
+            combine = None
+
+        nodes = []
+        for part in parts:
+            column, op, value = self._parse_condition(part)
+            field = schema.field(column)
+            nodes.append(builder.make_function(
+                _GANDIVA_FUNCTIONS[op],
+                [builder.make_field(field), builder.make_literal(value, field.type)],
+                pa.bool_()
+            ))
+
+        return nodes[0] if combine is None else combine(nodes)
+
+    def _apply_condition(self, table: pa.Table, column: str, op: str, value: Any) -> pa.Table:
+        """Apply a WHERE condition to an Arrow Table."""
+        mask = self._create_condition_mask(table, column, op, value)
+        return table.filter(mask)
+
+    def _create_condition_mask(self, table: pa.Table, column: str, op: str, value: Any):
+        """Create a boolean mask for a condition via Arrow compute kernels."""
+        col = table.column(column)
+
+        # Fast path: primitive numeric columns without nulls compare
+        # through a zero-copy NumPy view of the Arrow buffers, skipping
+        # any Series/scalar wrapping
+        mask = self._numpy_condition_mask(col, op, value)
+        if mask is not None:
+            return mask
+
         if op == '>':
-            return df[column] > value
+            return pc.greater(col, value)
         elif op == '<':
-            return df[column] < value
+            return pc.less(col, value)
         elif op == '=':
-            return df[column] == value
+            return pc.equal(col, value)
         elif op == '>=':
-            return df[column] >= value
+            return pc.greater_equal(col, value)
         elif op == '<=':
-            return df[column] <= value
+            return pc.less_equal(col, value)
         elif op == '!=':
-            return df[column] != value
+            return pc.not_equal(col, value)
         else:
             raise ValueError(f"Unsupported operator: {op}")
     
+    def close(self):
+        """Shut down the engine's persistent thread pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the persistent thread pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers or os.cpu_count())
+        return self._pool
+
     def clear_cache(self):
-        """Clear the table cache."""
+        """Clear the table, file-handle and directory-listing caches."""
         self.table_cache = {}
+        self._pq_file_cache = {}
+        self._file_list_cache = {}
+        self._gandiva_filter_cache = {}
+        self._result_cache = collections.OrderedDict()
+        self._result_cache_bytes = 0
+
+
+def _scan_partition_worker(file_meta: Dict, columns: Tuple[str, ...],
+                       filters: Tuple[Tuple, ...],
+                       parsed_query: ParsedQuery) -> Optional[bytes]:
+    """Process one partition inside a worker process.
+
+    Module-level so it pickles cleanly for ProcessPoolExecutor. The
+    resulting Arrow Table travels back as IPC stream bytes, which the
+    parent deserializes without re-copying the column buffers.
+
+    Args:
+        file_meta: File metadata dict (path, row-group statistics)
+        columns: Columns to read
+        filters: Pushdown filters
+        parsed_query: Parsed query information
+
+    Returns:
+        IPC stream bytes, or None if the partition produced no rows
+    """
+    engine = DremelQueryEngine(os.path.dirname(file_meta['path']))
+    table = engine._process_file_partition(
+        file_meta, list(columns), list(filters), parsed_query)
+    if table is None or len(table) == 0:
+        return None
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
 
 
 # Example usage
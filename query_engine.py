@@ -1,9 +1,105 @@
+import collections
+import functools
+import operator
 import os
 import re
 from typing import List, Dict, Tuple, Optional, Any, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
+import sqlparse
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Precompiled query patterns; re's internal cache still pays a lookup
+# and call per use, which adds up on short repeated queries
+_SELECT_RE = re.compile(r'(SELECT\s+.+?)\s+FROM', re.IGNORECASE)
+_FROM_RE = re.compile(r'FROM\s+([^\s;]+)', re.IGNORECASE)
+_WHERE_RE = re.compile(r'WHERE\s+(.+?)(?:\s+LIMIT\s+\d+\s*|$)', re.IGNORECASE)
+_LIMIT_RE = re.compile(r'LIMIT\s+(\d+)', re.IGNORECASE)
+_COMMENT_RE = re.compile(r'--.*?(\n|$)')
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_WHERE_PREFIX_RE = re.compile(r'^\s*WHERE\s+', re.IGNORECASE)
+_CONNECTOR_SPLIT_RE = re.compile(r'\s+AND\s+|\s+OR\s+', re.IGNORECASE)
+_COL_SPLIT_RE = re.compile(r',(?![^()]*\))')  # comma not inside parens
+
+# Operator dispatch tables; one dict lookup instead of a branch ladder,
+# and a single place to extend when new operators appear. The operator
+# module versions also build dataset expressions, since ds.field()
+# overloads the comparison dunders
+_OPS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '=': operator.eq,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '!=': operator.ne,
+}
+_ARROW_OPS = {
+    '>': pc.greater,
+    '<': pc.less,
+    '=': pc.equal,
+    '>=': pc.greater_equal,
+    '<=': pc.less_equal,
+    '!=': pc.not_equal,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _numba_comparison_kernel(op: str):
+    """Compile (and cache) a fused compare kernel for one operator.
+
+    Numba specializes the compiled function per input dtype on first
+    call, so caching by operator alone is enough; repeated predicate
+    shapes skip both the Python dispatch and the NumPy temporary.
+
+    Returns:
+        Compiled kernel, or None when numba is unavailable
+    """
+    if numba is None:
+        return None
+
+    if op == '>':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] > value
+    elif op == '<':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] < value
+    elif op == '=':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] == value
+    elif op == '>=':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] >= value
+    elif op == '<=':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] <= value
+    elif op == '!=':
+        def kernel(arr, value, out):
+            for i in numba.prange(arr.size):
+                out[i] = arr[i] != value
+    else:
+        return None
+
+    return numba.njit(parallel=True, fastmath=True)(kernel)
 
 
 class QueryEngine:
@@ -17,97 +113,163 @@ class QueryEngine:
     - LIMIT clause
     """
     
-    def __init__(self, data_path: str):
+    def __init__(self, data_path: str, cache_limit_bytes: int = 256 * 1024 * 1024):
         """Initialize the query engine with a data directory.
         
         Args:
             data_path: Directory path where parquet files are stored
+            cache_limit_bytes: Byte budget for the table cache; least
+                recently used tables are evicted once it is exceeded
         """
         self.data_path = data_path
-        self.table_cache = {}  # Cache for loaded tables
+        self.cache_limit_bytes = cache_limit_bytes
+        self.table_cache = collections.OrderedDict()  # LRU cache for loaded tables
+        self._cache_bytes = 0
+        self._colmap_cache = {}  # column-names tuple -> lowercase map
+        self._manifest = None  # table name -> parquet path, built lazily
+        # Let Arrow's decode pool use every core for parallel column reads
+        pa.set_cpu_count(os.cpu_count())
     
-    def execute_query(self, query: str) -> pd.DataFrame:
+    RETURN_FORMATS = ('pandas', 'arrow', 'numpy')
+
+    def execute_query(self, query: str,
+                  return_format: str = 'pandas') -> Union[pd.DataFrame, pa.Table, Dict[str, np.ndarray]]:
         """Execute a SQL query on parquet files.
         
         Args:
             query: SQL query string
+            return_format: 'pandas' for a DataFrame (default), 'arrow'
+                for the filtered pyarrow Table with no conversion copy,
+                or 'numpy' for a dict of column name -> ndarray
             
         Returns:
-            DataFrame with query results
+            Query results in the requested format
         
         Raises:
             RuntimeError: If query execution fails
         """
+        if return_format not in self.RETURN_FORMATS:
+            raise ValueError(
+                f"return_format must be one of {self.RETURN_FORMATS}, "
+                f"got {return_format!r}")
+
         try:
             # Parse the query
             parsed_query = self._parse_query(query)
-            
-            # Load the table
-            df = self._load_table(parsed_query["table"])
-            
+
+            # Push projection and filters down into the Parquet read so
+            # unused columns and excluded row groups are never decoded
+            filters = self._extract_filters(parsed_query["where"])
+            needed_columns = self._required_columns(parsed_query, filters)
+
+            # With a LIMIT, stream batches and stop reading as soon as
+            # enough matching rows have accumulated; only applies when
+            # the whole predicate is pushed down into the scan
+            table = None
+            where_handled = False
+            if parsed_query["limit"] is not None and \
+                    (filters is not None or not parsed_query["where"]):
+                table = self._scan_with_limit(parsed_query["table"],
+                                              needed_columns, filters,
+                                              parsed_query["limit"])
+                where_handled = table is not None
+
+            # Load the table as an Arrow Table; filtering and projection
+            # run on Arrow's vectorized kernels, and the pandas
+            # conversion happens once on the final result
+            if table is None:
+                table = self._load_table(parsed_query["table"],
+                                         columns=needed_columns,
+                                         filters=filters)
+            loaded = table
+
             # Apply WHERE conditions
-            if parsed_query["where"]:
-                df = self._apply_where_conditions(df, parsed_query["where"])
-            
+            if parsed_query["where"] and not where_handled:
+                table = self._apply_where_conditions(table, parsed_query["where"])
+
             # Select columns
             if parsed_query["columns"] != ['*']:
-                df = self._select_columns(df, parsed_query["columns"])
-            
+                table = self._select_columns(table, parsed_query["columns"])
+
             # Apply LIMIT
             if parsed_query["limit"] is not None:
-                df = df.head(parsed_query["limit"])
-            
-            return df
+                table = table.slice(0, parsed_query["limit"])
+
+            # Arrow consumers skip the pandas conversion entirely
+            if return_format == 'arrow':
+                return table
+            if return_format == 'numpy':
+                return {name: table.column(name).to_numpy(zero_copy_only=False)
+                        for name in table.column_names}
+
+            # Arrow-backed dtypes keep string columns off pandas object
+            # dtype and make the conversion zero-copy where possible.
+            # self_destruct must not run on the cached table itself, only
+            # on tables produced by filter/select/slice
+            return table.to_pandas(split_blocks=True,
+                                   self_destruct=table is not loaded,
+                                   types_mapper=pd.ArrowDtype)
             
         except Exception as e:
             raise RuntimeError(f"Query execution failed: {str(e)}")
     
     def clear_cache(self):
         """Clear the table cache."""
-        self.table_cache = {}
+        self.table_cache = collections.OrderedDict()
+        self._cache_bytes = 0
+        self._colmap_cache = {}
+        self._manifest = None
 
     # ---------- Query Parsing Methods ----------
     
-    def _parse_query(self, query: str) -> Dict[str, Any]:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_query(query: str) -> Dict[str, Any]:
         """Parse SQL query into components.
-        
+
+        Results are cached on the raw query string, so repeated queries
+        skip the regex work entirely.
+
         Args:
             query: SQL query string
-            
+
         Returns:
             Dictionary with query components (columns, table, where, limit)
-        
+
         Raises:
             ValueError: If query is invalid
         """
         # Clean query
-        query = self._clean_query(query)
-        
+        query = QueryEngine._clean_query(query)
+
         # Extract query parts
-        select_match = re.search(r'(SELECT\s+.+?)\s+FROM', query, re.IGNORECASE)
-        from_match = re.search(r'FROM\s+([^\s;]+)', query, re.IGNORECASE)
-        where_match = re.search(r'WHERE\s+(.+?)(?:\s+LIMIT\s+\d+\s*|$)', query, re.IGNORECASE)
-        
+        select_match = _SELECT_RE.search(query)
+        from_match = _FROM_RE.search(query)
+        where_match = _WHERE_RE.search(query)
+
         if not select_match or not from_match:
             raise ValueError("Query must contain both SELECT and FROM clauses")
-        
+
         select_part = select_match.group(1)
         from_part = from_match.group(0)
-        where_part = where_match.group(0) if where_match else ""
-        
+        # Keep only the condition text; group(0) would drag a trailing
+        # LIMIT clause into the predicate
+        where_part = f"WHERE {where_match.group(1)}" if where_match else ""
+
         # Parse components
-        columns = self._extract_columns(select_part)
-        table_name = self._extract_table_name(from_part)
-        limit_value = self._extract_limit(query)
-        
+        columns = QueryEngine._extract_columns(select_part)
+        table_name = QueryEngine._extract_table_name(from_part)
+        limit_value = QueryEngine._extract_limit(query)
+
         return {
             "columns": columns,
             "table": table_name,
             "where": where_part,
             "limit": limit_value
         }
-    
-    def _clean_query(self, query: str) -> str:
+
+    @staticmethod
+    def _clean_query(query: str) -> str:
         """Remove comments and normalize whitespace.
         
         Args:
@@ -117,13 +279,14 @@ class QueryEngine:
             Cleaned query
         """
         # Remove single-line comments
-        query = re.sub(r'--.*?(\n|$)', ' ', query)
+        query = _COMMENT_RE.sub(' ', query)
         # Remove multi-line comments
-        query = re.sub(r'/\*.*?\*/', ' ', query, flags=re.DOTALL)
+        query = _BLOCK_COMMENT_RE.sub(' ', query)
         # Normalize whitespace
         return ' '.join(query.split())
     
-    def _extract_columns(self, select_stmt: str) -> List[str]:
+    @staticmethod
+    def _extract_columns(select_stmt: str) -> List[str]:
         """Extract column names from SELECT statement.
         
         Args:
@@ -134,32 +297,14 @@ class QueryEngine:
         """
         if '*' in select_stmt:
             return ['*']
-        
-        # Remove 'SELECT' and parse columns
+
+        # Remove 'SELECT' and split on commas outside parentheses; one
+        # C-level regex pass instead of a per-character Python loop
         columns_part = select_stmt.strip().replace('SELECT', '', 1).strip()
-        columns = []
-        current_col = ""
-        paren_count = 0
-        
-        for char in columns_part:
-            if char == '(' and paren_count == 0:
-                paren_count += 1
-                current_col += char
-            elif char == ')' and paren_count > 0:
-                paren_count -= 1
-                current_col += char
-            elif char == ',' and paren_count == 0:
-                columns.append(current_col.strip())
-                current_col = ""
-            else:
-                current_col += char
-                
-        if current_col.strip():
-            columns.append(current_col.strip())
-            
-        return columns
+        return [col.strip() for col in _COL_SPLIT_RE.split(columns_part) if col.strip()]
     
-    def _extract_table_name(self, from_stmt: str) -> str:
+    @staticmethod
+    def _extract_table_name(from_stmt: str) -> str:
         """Extract table name from FROM statement.
         
         Args:
@@ -171,12 +316,71 @@ class QueryEngine:
         Raises:
             ValueError: If table name cannot be extracted
         """
-        match = re.search(r'FROM\s+([^\s;]+)', from_stmt, re.IGNORECASE)
+        match = _FROM_RE.search(from_stmt)
         if match:
             return match.group(1).strip()
         raise ValueError(f"Could not extract table name from: {from_stmt}")
     
-    def _extract_limit(self, query: str) -> Optional[int]:
+    def _extract_filters(self, where_clause: str) -> Optional[List]:
+        """Translate a WHERE clause into a Parquet DNF filter list.
+
+        AND chains become one conjunct list, OR chains a list of
+        single-condition lists; mixed or unparseable clauses return None
+        so the read falls back to in-memory filtering.
+
+        Args:
+            where_clause: The WHERE part of the SQL query
+
+        Returns:
+            Filter list for pq.read_table(filters=...), or None
+        """
+        if not where_clause:
+            return None
+
+        ast = self._parse_where_ast(where_clause)
+        if ast is None:
+            return None  # Mixed connectors or unparseable; no pushdown
+
+        connector, conditions = ast
+        if connector == 'OR' and len(conditions) > 1:
+            return [[condition] for condition in conditions]
+        return list(conditions)
+
+    def _required_columns(self, parsed_query: Dict[str, Any],
+                      filters: Optional[List]) -> Optional[List[str]]:
+        """Collect the columns a query actually touches.
+
+        Args:
+            parsed_query: Parsed query components
+            filters: Pushdown filters from _extract_filters
+
+        Returns:
+            Selected plus predicate columns, or None for SELECT *
+        """
+        if parsed_query["columns"] == ['*']:
+            return None
+
+        needed = list(parsed_query["columns"])
+        if filters:
+            for conjunct in filters:
+                conditions = conjunct if isinstance(conjunct, list) else [conjunct]
+                for column, _, _ in conditions:
+                    if column not in needed:
+                        needed.append(column)
+        elif parsed_query["where"]:
+            # No pushdown, but the in-memory filter still needs its columns
+            condition_text = _WHERE_PREFIX_RE.sub('', parsed_query["where"])
+            for condition in _CONNECTOR_SPLIT_RE.split(condition_text):
+                try:
+                    column, _, _ = self._parse_condition(condition)
+                except ValueError:
+                    return None  # Unparseable predicate; read everything
+                if column not in needed:
+                    needed.append(column)
+        return needed
+
+    @staticmethod
+    def _extract_limit(query: str) -> Optional[int]:
         """Extract LIMIT value from query.
         
         Args:
@@ -185,135 +389,492 @@ class QueryEngine:
         Returns:
             Limit value or None if not specified
         """
-        match = re.search(r'LIMIT\s+(\d+)', query, re.IGNORECASE)
+        match = _LIMIT_RE.search(query)
         if match:
             return int(match.group(1))
         return None
     
     # ---------- Data Loading Methods ----------
     
-    def _load_table(self, table_name: str) -> pd.DataFrame:
-        """Load a parquet table into a DataFrame.
-        
+    def _load_table(self, table_name: str, columns: Optional[List[str]] = None,
+                filters: Optional[List] = None) -> pa.Table:
+        """Load a parquet table as an Arrow Table.
+
+        Columns and filters are pushed down to the Parquet reader, so
+        only the requested columns are decoded and row groups whose
+        statistics exclude the filters are skipped. Keeping the result
+        in Arrow avoids the pandas conversion cost on cached tables.
+
         Args:
             table_name: Name of the table (file name without extension)
-            
+            columns: Columns to read, or None for all
+            filters: DNF filter list for row-group pushdown, or None
+
         Returns:
-            Pandas DataFrame
-        
+            Arrow Table
+
         Raises:
             FileNotFoundError: If parquet file is not found
         """
-        # Check cache first
-        if table_name in self.table_cache:
-            return self.table_cache[table_name]
-        
-        # Possible file paths to search
-        possible_paths = [
-            os.path.join(self.data_path, f"{table_name}.parquet"),
-            os.path.join(self.data_path, table_name, f"{table_name}.parquet"),
-            os.path.join(self.data_path, table_name),
-        ]
-        
-        # Try all possible paths
-        for file_path in possible_paths:
-            if not os.path.exists(file_path):
-                continue
-                
+        # Check cache first; distinct projections/filters cache separately
+        cache_key = (table_name, tuple(columns) if columns else None, str(filters))
+        cached = self.table_cache.get(cache_key)
+        if cached is not None:
+            self.table_cache.move_to_end(cache_key)
+            return cached
+
+        file_path = self._resolve_table_path(table_name)
+
+        # Files too large for the cache are filtered batch by batch, so
+        # peak memory stays near one batch plus the surviving rows
+        # instead of the whole decoded file
+        if filters is not None:
             try:
-                # Handle directory case
-                if os.path.isdir(file_path):
-                    parquet_files = [f for f in os.listdir(file_path) if f.endswith('.parquet')]
-                    if not parquet_files:
-                        continue
-                    file_path = os.path.join(file_path, parquet_files[0])
-                
-                # Load the parquet file
-                table = pq.read_table(file_path)
-                df = table.to_pandas()
-                self.table_cache[table_name] = df
-                return df
-                
-            except Exception as e:
-                continue  # Try next path
-        
-        # If we get here, we couldn't find the table
-        raise FileNotFoundError(f"Parquet file not found for table: {table_name}")
+                oversized = os.path.getsize(file_path) > self.cache_limit_bytes
+            except OSError:
+                oversized = False
+            if oversized:
+                table = self._stream_filtered_table(file_path, columns, filters)
+                if table is not None:
+                    self._cache_table(cache_key, table)
+                    return table
+
+        # Load the parquet file with pushdown where possible; a
+        # case-mismatched column name falls back to a full read.
+        # Threaded decode parallelizes decompression across columns and
+        # memory mapping shares page-cache pages across queries
+        try:
+            table = pq.read_table(file_path, columns=columns, filters=filters,
+                                  use_threads=True, memory_map=True,
+                                  pre_buffer=True)
+        except Exception:
+            table = pq.read_table(file_path, use_threads=True, memory_map=True,
+                                  pre_buffer=True)
+        self._cache_table(cache_key, table)
+        return table
+
+    def _resolve_table_path(self, table_name: str) -> str:
+        """Resolve a table name to its parquet file path.
+
+        Resolution goes through a manifest built once with a single
+        directory scan, instead of issuing several exists/isdir/listdir
+        syscalls per query. clear_cache() rebuilds the manifest.
+
+        Args:
+            table_name: Name of the table (file name without extension)
+
+        Returns:
+            Path to the table's parquet file
+
+        Raises:
+            FileNotFoundError: If parquet file is not found
+        """
+        if self._manifest is None:
+            self._manifest = self._build_manifest()
+
+        file_path = self._manifest.get(table_name)
+        if file_path is None:
+            raise FileNotFoundError(f"Parquet file not found for table: {table_name}")
+        return file_path
+
+    def _build_manifest(self) -> Dict[str, str]:
+        """Map every table in the data directory to its parquet file.
+
+        Top-level ``<table>.parquet`` files win over ``<table>/``
+        directories, matching the old probe order; inside a directory,
+        ``<table>.parquet`` is preferred, then the first parquet file.
+
+        Returns:
+            Dictionary of table name -> parquet file path
+        """
+        manifest = {}
+        directories = []
+        try:
+            with os.scandir(self.data_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith('.parquet'):
+                        manifest[entry.name[:-len('.parquet')]] = entry.path
+                    elif entry.is_dir():
+                        directories.append(entry)
+        except OSError:
+            return manifest
+
+        for entry in directories:
+            if entry.name in manifest:
+                continue  # A top-level file already claimed the name
+            try:
+                children = sorted(child.name for child in os.scandir(entry.path)
+                                  if child.is_file() and child.name.endswith('.parquet'))
+            except OSError:
+                continue
+            if not children:
+                continue
+            preferred = f"{entry.name}.parquet"
+            chosen = preferred if preferred in children else children[0]
+            manifest[entry.name] = os.path.join(entry.path, chosen)
+
+        return manifest
+
+    def _stream_filtered_table(self, file_path: str,
+                           columns: Optional[List[str]],
+                           filters: List) -> Optional[pa.Table]:
+        """Filter a parquet file one record batch at a time.
+
+        Only the current batch and the rows that survive the filter are
+        ever materialized, capping the working set for large files whose
+        full decode would not fit the cache budget anyway. LIMIT
+        early-exit is handled upstream by _scan_with_limit.
+
+        Args:
+            file_path: Path to the parquet file
+            columns: Columns to read, or None for all
+            filters: DNF filter list covering the predicate
+
+        Returns:
+            Filtered table, or None when streaming does not apply
+        """
+        try:
+            expression = self._filters_to_expression(filters)
+            pq_file = pq.ParquetFile(file_path)
+            parts = []
+            for batch in pq_file.iter_batches(batch_size=65536, columns=columns,
+                                              use_threads=True):
+                filtered = pa.Table.from_batches([batch]).filter(expression)
+                if filtered.num_rows > 0:
+                    parts.append(filtered)
+            if parts:
+                return pa.concat_tables(parts)
+            schema = pq_file.schema_arrow
+            if columns:
+                schema = pa.schema([schema.field(name) for name in columns])
+            return schema.empty_table()
+        except Exception:
+            return None  # e.g. case-mismatched columns; full read handles it
+
+    def _scan_with_limit(self, table_name: str, columns: Optional[List[str]],
+                     filters: Optional[List], limit: int) -> Optional[pa.Table]:
+        """Stream batches and stop once the LIMIT is covered.
+
+        Avoids decoding the whole file when only the first ``limit``
+        matching rows are needed; row groups excluded by the pushed-down
+        filter expression are skipped by the scanner. Not used when the
+        table is already cached, since slicing the cached table is
+        cheaper than a fresh scan.
+
+        Args:
+            table_name: Name of the table
+            columns: Columns to read, or None for all
+            filters: DNF filter list covering the whole WHERE clause
+            limit: Maximum number of rows needed
+
+        Returns:
+            Filtered table with at least ``limit`` rows (or all matching
+            rows), or None when the streaming path does not apply
+        """
+        cache_key = (table_name, tuple(columns) if columns else None, str(filters))
+        if cache_key in self.table_cache:
+            return None
+
+        try:
+            file_path = self._resolve_table_path(table_name)
+        except FileNotFoundError:
+            return None  # Let the normal load path raise
+
+        try:
+            dataset = ds.dataset(file_path, format='parquet')
+            scanner = dataset.scanner(columns=columns,
+                                      filter=self._filters_to_expression(filters),
+                                      batch_size=64000)
+            batches = []
+            row_count = 0
+            for batch in scanner.to_batches():
+                if batch.num_rows == 0:
+                    continue
+                batches.append(batch)
+                row_count += batch.num_rows
+                if row_count >= limit:
+                    break
+        except Exception:
+            return None  # e.g. case-mismatched columns; full read handles it
+
+        if not batches:
+            return scanner.projected_schema.empty_table()
+        return pa.Table.from_batches(batches)
+
+    @staticmethod
+    def _filters_to_expression(filters: Optional[List]):
+        """Convert a DNF filter list into a dataset filter expression.
+
+        Args:
+            filters: Output of _extract_filters, or None
+
+        Returns:
+            pyarrow dataset Expression, or None for no filter
+        """
+        if not filters:
+            return None
+
+        disjuncts = []
+        conjuncts = [filters] if not isinstance(filters[0], list) else filters
+        for conjunct in conjuncts:
+            expression = None
+            for column, op, value in conjunct:
+                compare = _OPS.get(op)
+                if compare is None:
+                    raise ValueError(f"Unsupported operator: {op}")
+                term = compare(ds.field(column), value)
+                expression = term if expression is None else expression & term
+            disjuncts.append(expression)
+
+        combined = disjuncts[0]
+        for expression in disjuncts[1:]:
+            combined = combined | expression
+        return combined
     
-    def _select_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
-        """Select columns from DataFrame, handling case sensitivity.
-        
+    def _cache_table(self, cache_key: Tuple, table: pa.Table):
+        """Insert a table into the LRU cache, evicting over the budget.
+
+        Tables larger than the whole budget are not cached at all, so a
+        single oversized table cannot flush every other entry.
+
         Args:
-            df: Input DataFrame
+            cache_key: (table_name, columns, filters) cache key
+            table: Loaded Arrow Table
+        """
+        if table.nbytes > self.cache_limit_bytes:
+            return
+        self.table_cache[cache_key] = table
+        self.table_cache.move_to_end(cache_key)
+        self._cache_bytes += table.nbytes
+        while self._cache_bytes > self.cache_limit_bytes:
+            _, evicted = self.table_cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
+
+    def _select_columns(self, table: pa.Table, columns: List[str]) -> pa.Table:
+        """Select columns from a table, handling case sensitivity.
+
+        Args:
+            table: Input Arrow Table
             columns: List of column names to select
-            
+
         Returns:
-            DataFrame with selected columns
-            
+            Table with selected columns
+
         Raises:
             ValueError: If column is not found
         """
+        # Build the lowercase lookup once per distinct schema; each
+        # requested column then resolves with two dict lookups instead
+        # of a scan over every table column
+        names = tuple(table.column_names)
+        cached = self._colmap_cache.get(names)
+        if cached is None:
+            cached = (frozenset(names), {name.lower(): name for name in names})
+            self._colmap_cache[names] = cached
+        exact_names, colmap = cached
+
         actual_columns = []
-        
         for col in columns:
-            # Try exact match first
-            if col in df.columns:
+            # Try exact match first, then case-insensitive
+            if col in exact_names:
                 actual_columns.append(col)
             else:
-                # Try case-insensitive match
-                matches = [c for c in df.columns if c.lower() == col.lower()]
-                if matches:
-                    actual_columns.append(matches[0])
+                match = colmap.get(col.lower())
+                if match is not None:
+                    actual_columns.append(match)
                 else:
                     raise ValueError(f"Column not found: {col}")
-        
-        return df[actual_columns]
+
+        return table.select(actual_columns)
     
     # ---------- WHERE Clause Handling ----------
     
-    def _apply_where_conditions(self, df: pd.DataFrame, where_clause: str) -> pd.DataFrame:
-        """Apply WHERE conditions to the DataFrame.
-        
+    def _apply_where_conditions(self, table: pa.Table, where_clause: str) -> pa.Table:
+        """Apply WHERE conditions to the table.
+
+        Condition masks are combined into one boolean mask so the
+        surviving rows are gathered in a single filter pass, instead of
+        rebuilding the table per conjunct.
+
         Args:
-            df: Input DataFrame
+            table: Input Arrow Table
             where_clause: The WHERE part of the SQL query
-            
+
         Returns:
-            Filtered DataFrame
+            Filtered Arrow Table
         """
         if not where_clause:
-            return df
-            
-        # Remove 'WHERE' keyword
-        where_clause = re.sub(r'^\s*WHERE\s+', '', where_clause, flags=re.IGNORECASE)
-        
-        # Handle AND conditions
-        if ' AND ' in where_clause.upper():
-            conditions = where_clause.split(' AND ')
-            for condition in conditions:
-                column, op, value = self._parse_condition(condition)
-                df = self._apply_condition(df, column, op, value)
-            return df
-            
+            return table
+
+        ast = self._parse_where_ast(where_clause)
+        if ast is None:
+            raise ValueError(f"Unsupported WHERE clause: {where_clause}")
+        connector, conditions = ast
+        conditions = list(conditions)
+
         # Handle OR conditions
-        elif ' OR ' in where_clause.upper():
-            conditions = where_clause.split(' OR ')
-            mask = pd.Series(False, index=df.index)
-            
-            for condition in conditions:
-                column, op, value = self._parse_condition(condition)
-                mask |= self._create_condition_mask(df, column, op, value)
-                
-            return df[mask]
-            
+        if connector == 'OR' and len(conditions) > 1:
+            fused = self._numexpr_mask(table, conditions, '|')
+            if fused is not None:
+                return table.filter(pa.array(fused))
+
+            # Merge terms in place with np.logical_or instead of
+            # allocating a fresh combined mask per term, and stop once
+            # every row is already selected
+            mask = None
+            for column, op, value in conditions:
+                col = table.column(column)
+                term = self._numpy_surviving_mask(col, op, value, None,
+                                                  table.num_rows)
+                if term is None:
+                    arrow_mask = self._column_mask(col, op, value)
+                    term = pc.fill_null(arrow_mask, False).to_numpy(
+                        zero_copy_only=False)
+                if mask is None:
+                    mask = np.array(term, dtype=np.bool_)
+                else:
+                    np.logical_or(mask, term, out=mask)
+                if mask.all():
+                    break
+
+            return table.filter(pa.array(mask))
+
+        # Single condition
+        if len(conditions) == 1:
+            column, op, value = conditions[0]
+            return self._apply_condition(table, column, op, value)
+
+        # AND chain: fuse numeric predicates into one numexpr pass when
+        # possible
+        fused = self._numexpr_mask(table, conditions, '&')
+        if fused is not None:
+            return table.filter(pa.array(fused))
+
+        # Evaluate cheap, typically selective predicates (equality)
+        # first, and each later conjunct only on the rows that
+        # survived the previous ones; a single take at the end
+        # gathers the result columns once
+        conditions.sort(key=lambda c: 0 if c[1] in ('=', '!=') else 1)
+        surviving = np.arange(table.num_rows, dtype=np.int64)
+        for column, op, value in conditions:
+            if surviving.size == 0:
+                break
+            col = table.column(column)
+            mask = self._numpy_surviving_mask(col, op, value, surviving,
+                                              table.num_rows)
+            if mask is None:
+                subset = col if surviving.size == table.num_rows \
+                    else col.take(pa.array(surviving))
+                arrow_mask = self._column_mask(subset, op, value)
+                mask = pc.fill_null(arrow_mask, False).to_numpy(zero_copy_only=False)
+            surviving = surviving[mask]
+        if surviving.size == table.num_rows:
+            return table  # Nothing filtered; skip the gather entirely
+        return table.take(pa.array(surviving))
+
+    @staticmethod
+    def _numpy_surviving_mask(col, op: str, value: Any,
+                          surviving: np.ndarray, total_rows: int):
+        """Evaluate a conjunct on the surviving rows as NumPy slices.
+
+        For null-free numeric columns the column becomes a NumPy view
+        once and the comparison runs on ``arr[surviving]``, so each
+        later conjunct touches only the rows still alive without an
+        Arrow take allocation per step.
+
+        Returns:
+            Boolean mask over the surviving rows (all rows when
+            ``surviving`` is None), or None when the NumPy path does
+            not apply
+        """
+        if not (pa.types.is_integer(col.type) or pa.types.is_floating(col.type)):
+            return None
+        if col.null_count != 0:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+
+        try:
+            arr = col.to_numpy(zero_copy_only=False)
+        except (pa.ArrowInvalid, ValueError):
+            return None
+        if surviving is None or surviving.size == total_rows:
+            subset = arr
         else:
-            # Single condition
-            column, op, value = self._parse_condition(where_clause)
-            return self._apply_condition(df, column, op, value)
+            subset = arr[surviving]
+
+        # Prefer the jitted kernel, which fuses compare and store into
+        # one pass without a NumPy temporary
+        kernel = _numba_comparison_kernel(op) if numba is not None else None
+        if kernel is not None:
+            out = np.empty(subset.size, dtype=np.bool_)
+            try:
+                kernel(subset, value, out)
+                return out
+            except Exception:
+                pass  # Unsupported combination; use the NumPy operators
+
+        compare = _OPS.get(op)
+        if compare is None:
+            return None
+        return compare(subset, value)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_where_ast(where_clause: str) -> Optional[Tuple[str, Tuple]]:
+        """Parse a WHERE clause into (connector, conditions) via sqlparse.
+
+        Tokenizing with sqlparse keeps string literals intact, so an
+        ``' AND '`` inside a quoted value can no longer split a
+        condition the way the old string splitting did, and every
+        downstream consumer (pushdown, numexpr, short-circuit) shares
+        one parsed representation.
+
+        Args:
+            where_clause: The WHERE part of the SQL query
+
+        Returns:
+            ('AND' | 'OR', tuple of (column, op, value)), or None for
+            mixed connectors or clauses sqlparse cannot tokenize
+        """
+        condition_text = _WHERE_PREFIX_RE.sub('', where_clause)
+
+        try:
+            statement = sqlparse.parse(condition_text)[0]
+        except Exception:
+            return None
+
+        conditions = []
+        connectors = set()
+        for token in statement.tokens:
+            if token.is_whitespace:
+                continue
+            if isinstance(token, sqlparse.sql.Comparison):
+                try:
+                    conditions.append(QueryEngine._parse_condition(str(token).strip()))
+                except ValueError:
+                    return None
+            elif token.ttype is sqlparse.tokens.Keyword and \
+                    token.normalized in ('AND', 'OR'):
+                connectors.add(token.normalized)
+            else:
+                return None  # Unrecognized construct; don't guess
+
+        if not conditions or len(connectors) > 1:
+            return None
+        if len(conditions) > 1 and not connectors:
+            return None
+
+        connector = connectors.pop() if connectors else 'AND'
+        return connector, tuple(conditions)
     
-    def _parse_condition(self, condition: str) -> Tuple[str, str, Any]:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _parse_condition(condition: str) -> Tuple[str, str, Any]:
         """Parse a WHERE condition into column, operator, and value.
-        
+
+        Cached; templated queries repeat the same condition strings.
+
         Args:
             condition: A single condition from WHERE clause
             
@@ -349,53 +910,144 @@ class QueryEngine:
         
         raise ValueError(f"No valid operator found in condition: {condition}")
     
-    def _apply_condition(self, df: pd.DataFrame, column: str, op: str, value: Any) -> pd.DataFrame:
-        """Apply a WHERE condition to the DataFrame.
-        
+    def _numexpr_mask(self, table: pa.Table, conditions: List[Tuple],
+                  connector: str):
+        """Evaluate a multi-term numeric predicate in one numexpr pass.
+
+        numexpr fuses all comparisons and the boolean reduction into a
+        single loop over each column, avoiding one temporary boolean
+        array per term. Only applies to null-free numeric columns with
+        numeric literals; string comparisons stay on the Arrow kernels,
+        where numexpr is weak.
+
+        Args:
+            table: Input Arrow Table
+            conditions: List of (column, op, value) tuples
+            connector: '&' for AND chains, '|' for OR chains
+
+        Returns:
+            NumPy boolean mask, or None when the fused path does not apply
+        """
+        if ne is None or len(conditions) < 2:
+            return None
+
+        arrays = {}
+        for column, op, value in conditions:
+            if column not in table.column_names:
+                return None
+            col = table.column(column)
+            if not (pa.types.is_integer(col.type) or pa.types.is_floating(col.type)):
+                return None
+            if col.null_count != 0:
+                return None
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None
+            arrays[f"c{len(arrays)}"] = col.to_numpy(zero_copy_only=False)
+
+        expression = self._numexpr_expression(
+            tuple(op for _, op, _ in conditions),
+            tuple(value for _, _, value in conditions),
+            connector)
+        try:
+            return ne.evaluate(expression, local_dict=arrays, global_dict={})
+        except Exception:
+            return None  # Fall back to the Arrow kernels
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _numexpr_expression(ops: Tuple[str, ...], values: Tuple, connector: str) -> str:
+        """Build (and cache) the numexpr string for a predicate shape."""
+        terms = []
+        for index, (op, value) in enumerate(zip(ops, values)):
+            op = '==' if op == '=' else op
+            terms.append(f"(c{index} {op} {value!r})")
+        return f" {connector} ".join(terms)
+
+    @staticmethod
+    def _dictionary_equality_mask(col, op: str, value: str):
+        """Evaluate string equality on dictionary codes.
+
+        Low-cardinality string columns compare much faster as integer
+        codes: the value is looked up once per dictionary (a handful of
+        strings) and the per-row work is an int32 comparison instead of
+        a byte-wise string compare.
+
+        Args:
+            col: String or dictionary-encoded ChunkedArray
+            op: '=' or '!='
+            value: String literal to compare against
+
+        Returns:
+            Boolean ChunkedArray mask, or None when encoding fails
+        """
+        try:
+            if pa.types.is_dictionary(col.type):
+                encoded = col
+            elif pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+                encoded = pc.dictionary_encode(col)
+            else:
+                return None
+        except pa.ArrowNotImplementedError:
+            return None
+
+        kernel = pc.equal if op == '=' else pc.not_equal
+        chunk_masks = []
+        for chunk in encoded.chunks:
+            # index() returns -1 when the value is absent, which no
+            # valid code ever equals, so the comparison still works
+            code = pc.index(chunk.dictionary, value).as_py()
+            chunk_masks.append(kernel(chunk.indices, code))
+        return pa.chunked_array(chunk_masks, type=pa.bool_())
+
+    def _apply_condition(self, table: pa.Table, column: str, op: str, value: Any) -> pa.Table:
+        """Apply a WHERE condition to the table.
+
         Args:
-            df: Input DataFrame
+            table: Input Arrow Table
             column: Column name to filter on
             op: Operator (>, <, =, >=, <=, !=)
             value: Value to compare against
-            
+
         Returns:
-            Filtered DataFrame
-            
+            Filtered Arrow Table
+
         Raises:
             ValueError: If operator is not supported
         """
-        mask = self._create_condition_mask(df, column, op, value)
-        return df[mask]
-    
-    def _create_condition_mask(self, df: pd.DataFrame, column: str, op: str, value: Any) -> pd.Series:
+        mask = self._create_condition_mask(table, column, op, value)
+        return table.filter(mask)
+
+    def _create_condition_mask(self, table: pa.Table, column: str, op: str, value: Any):
         """Create a boolean mask for a condition.
-        
+
+        The comparison runs in Arrow's vectorized compute kernels rather
+        than through pandas Series dispatch.
+
         Args:
-            df: Input DataFrame
+            table: Input Arrow Table
             column: Column name
             op: Operator
             value: Value to compare against
-            
+
         Returns:
-            Boolean mask
-            
+            Boolean mask (Arrow ChunkedArray)
+
         Raises:
             ValueError: If operator is not supported
         """
-        if op == '>':
-            return df[column] > value
-        elif op == '<':
-            return df[column] < value
-        elif op == '=':
-            return df[column] == value
-        elif op == '>=':
-            return df[column] >= value
-        elif op == '<=':
-            return df[column] <= value
-        elif op == '!=':
-            return df[column] != value
-        else:
+        return self._column_mask(table.column(column), op, value)
+
+    @staticmethod
+    def _column_mask(col, op: str, value: Any):
+        """Create a boolean mask for a condition on a single column."""
+        if op in ('=', '!=') and isinstance(value, str):
+            mask = QueryEngine._dictionary_equality_mask(col, op, value)
+            if mask is not None:
+                return mask
+        kernel = _ARROW_OPS.get(op)
+        if kernel is None:
             raise ValueError(f"Unsupported operator: {op}")
+        return kernel(col, value)
 
 
 # Example usage